@@ -4,16 +4,19 @@
 import sys, os
 import threading
 import re
+import functools
 import json
 import hashlib
 import html as _html
+from html.parser import HTMLParser
 import time
 import winreg
 from datetime import datetime
 from PySide6.QtCore import Qt, QSize, QTimer, Signal, QPoint, Slot, QThread, QStandardPaths, QUrl
 from PySide6.QtGui import (
     QAction, QKeySequence, QTextCharFormat, QTextCursor, QTextListFormat,
-    QFont, QColor, QGuiApplication, QFontDatabase, QClipboard, QPalette, QIcon, QPixmap, QDesktopServices, QMovie
+    QFont, QColor, QGuiApplication, QClipboard, QPalette, QIcon, QPixmap, QPixmapCache,
+    QDesktopServices, QMovie
 )
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QToolBar, QVBoxLayout, QHBoxLayout,
@@ -180,27 +183,57 @@ SPEC_TABLE_CSS = SPEC_TABLE_CSS.replace(
     f"padding-bottom:{EXPORT_SECTION_PADDING_Y_PX}px;}}\n</style>"
 )
 
+# Export HTML skeleton, frozen at import time; only the row interiors are
+# formatted per export.
+_TABLE_HEAD = (
+    '<table border="1" class="specs">\n\t<thead>\n\t\t<tr>\n'
+    '\t\t\t<th>{lh}</th>\n\t\t\t<th>{rh}</th>\n\t\t</tr>\n\t</thead>\n\t<tbody>\n'
+)
+_TABLE_TAIL = '\t</tbody>\n</table>'
+_ROW_TMPL = '\t\t<tr>\n\t\t\t<th>{k}</th>\n\t\t\t<td>{v}</td>\n\t\t</tr>\n'
+_SECTION_ROW_TMPL = '\t\t<tr class="section">\n\t\t\t<th class="section" colspan="2">{t}</th>\n\t\t</tr>\n'
+_CAT_ROW_TMPL = '\t\t<tr class="cat">\n\t\t\t<th class="category" colspan="2">{t}</th>\n\t\t</tr>\n'
+
 
 # ---------- helpers / theme ----------
 def resource_path(relative_path):
     base_path = getattr(sys, "_MEIPASS", os.path.abspath("."))
     return os.path.join(base_path, relative_path)
 
-def try_set_modern_app_font():
-    families = set(QFontDatabase.families())
-    for name in ("Aptos", "Segoe UI Variable", "Segoe UI", "Inter", "SF Pro Text", "Helvetica Neue"):
-        if name in families:
-            QGuiApplication.setFont(QFont(name, 10))
-            return
 
-def apply_brand_theme(app: QApplication):
-    pal = app.palette()
-    pal.setColor(QPalette.Highlight, QColor(ACCENT))
-    pal.setColor(QPalette.HighlightedText, QColor("#ffffff"))
-    pal.setColor(QPalette.Link, QColor(ACCENT))
-    pal.setColor(QPalette.LinkVisited, QColor(ACCENT).darker(110))
-    app.setPalette(pal)
-    app.setStyleSheet(f"""
+@functools.lru_cache(maxsize=None)
+def _icon(path):
+    """QIcon per resource path, loaded from disk at most once."""
+    return QIcon(resource_path(path))
+
+
+def _cached_pixmap(key, path):
+    """Decode a static image once and serve later requests from QPixmapCache."""
+    pm = QPixmap()
+    if not QPixmapCache.find(key, pm):
+        pm.load(resource_path(path))
+        QPixmapCache.insert(key, pm)
+    return pm
+
+_font_set = False
+
+
+def try_set_modern_app_font():
+    # Memoized; cannot change mid-run.
+    global _font_set
+    if _font_set:
+        return
+    _font_set = True
+    # Let Qt resolve the first installed family in C++ against its cached
+    # font database instead of enumerating every family into Python.
+    f = QFont()
+    f.setFamilies(["Aptos", "Segoe UI Variable", "Segoe UI", "Inter", "SF Pro Text", "Helvetica Neue"])
+    f.setPointSize(10)
+    QGuiApplication.setFont(f)
+
+# Precomputed once: ACCENT & co are constants, and every setStyleSheet call
+# makes Qt re-parse the CSS and re-polish the whole widget tree.
+_BRAND_QSS = f"""
     QLabel[class="section"] {{
         color: {ACCENT}; font-weight: 700; font-size: 20px; padding: 6px 0;
     }}
@@ -319,14 +352,53 @@ def apply_brand_theme(app: QApplication):
         text-transform:none;       /* change to uppercase if you prefer */
         letter-spacing:.2px;
     }}
-    """)
+    """
+
+_theme_applied = False
+
+
+def apply_brand_theme(app: QApplication):
+    global _theme_applied
+    if _theme_applied:
+        return
+    _theme_applied = True
+    pal = app.palette()
+    pal.setColor(QPalette.Highlight, QColor(ACCENT))
+    pal.setColor(QPalette.HighlightedText, QColor("#ffffff"))
+    pal.setColor(QPalette.Link, QColor(ACCENT))
+    pal.setColor(QPalette.LinkVisited, QColor(ACCENT).darker(110))
+    app.setPalette(pal)
+    app.setStyleSheet(_BRAND_QSS)
 
 def make_separator() -> QFrame:
     line = QFrame(); line.setFrameShape(QFrame.HLine); line.setFrameShadow(QFrame.Sunken); return line
 
+# \w keeps unicode letters (umlauts in German titles) like isalnum() did.
+_FNAME_BAD_RE = re.compile(r"[^\w\s-]+")
+_FNAME_WS_RE = re.compile(r"\s+")
+
+
+def _sanitize_filename(name: str) -> str:
+    cleaned = _FNAME_WS_RE.sub("_", _FNAME_BAD_RE.sub("_", name).strip())
+    return cleaned or DEFAULT_EXPORT_TITLE
+
+
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
 def _escape_html(text: str) -> str:
-    return (text.replace("&", "&amp;").replace("<", "&lt;")
-                .replace(">", "&gt;").replace('"', "&quot;"))
+    # Single C-level pass instead of four chained replace() scans.
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+_HTML_ESCAPE_BR_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "\n": "<br />"}
+)
+
+
+def _escape_html_br(text: str) -> str:
+    # Escape plus newline -> <br /> in the same single pass.
+    return text.translate(_HTML_ESCAPE_BR_TABLE)
 
 def _normalize_for_paste(t: str) -> str:
     # Map ß/ẞ → ss/SS (idempotent)
@@ -467,41 +539,28 @@ def _openai_translate_html(html: str, model_override: str | None = None) -> str:
 
 
 def _build_table_from_snapshot(snapshot, left_h, right_h, translate_label_fn, translate_value_fn):
-    lines = []
-    lines.append(SPEC_TABLE_CSS)
-    lines.append('<table border="1" class="specs">')
-    lines.append("\t<thead>")
-    lines.append("\t\t<tr>")
-    lines.append(f"\t\t\t<th>{_escape_html(translate_label_fn(left_h))}</th>")
-    lines.append(f"\t\t\t<th>{_escape_html(translate_label_fn(right_h))}</th>")
-    lines.append("\t\t</tr>")
-    lines.append("\t</thead>")
-    lines.append("\t<tbody>")
+    parts = [
+        SPEC_TABLE_CSS,
+        "\n",
+        _TABLE_HEAD.format(lh=_escape_html(translate_label_fn(left_h)),
+                           rh=_escape_html(translate_label_fn(right_h))),
+    ]
+    append = parts.append
 
     for kind, a, b in snapshot:
         if kind == "section":
-            title = _escape_html(translate_label_fn(a))
-            lines.append('\t\t<tr class="section">')
-            lines.append(f'\t\t\t<th class="section" colspan="2">{title}</th>')
-            lines.append('\t\t</tr>')
+            append(_SECTION_ROW_TMPL.format(t=_escape_html(translate_label_fn(a))))
         elif kind == "cat":
-            title = _escape_html(translate_label_fn(a))
-            lines.append('\t\t<tr class="cat">')
-            lines.append(f'\t\t\t<th class="category" colspan="2">{title}</th>')
-            lines.append('\t\t</tr>')
+            append(_CAT_ROW_TMPL.format(t=_escape_html(translate_label_fn(a))))
         else:
             k = _escape_html(translate_label_fn(a))
             v = translate_value_fn(b)
             if not (k or v):
                 continue
-            lines.append("\t\t<tr>")
-            lines.append(f"\t\t\t<th>{k}</th>")
-            lines.append(f"\t\t\t<td>{v}</td>")
-            lines.append("\t\t</tr>")
+            append(_ROW_TMPL.format(k=k, v=v))
 
-    lines.append("\t</tbody>")
-    lines.append("</table>")
-    return "\n".join(lines)
+    append(_TABLE_TAIL)
+    return "".join(parts)
 
 class ExportWorker(QThread):
     finished = Signal(dict)
@@ -523,7 +582,7 @@ class ExportWorker(QThread):
                 self.snapshot, self.left_h, self.right_h, lambda s: s, lambda s: s
             )
             out_de = _normalize_for_paste(out_de)
-            with open(self.path_de, "w", encoding="utf-8") as f:
+            with open(self.path_de, "w", encoding="utf-8", newline="\n") as f:
                 f.write(out_de)
 
             # 2. Systematic Translation (Separate content from structure) + Cache + JSON protocol
@@ -583,7 +642,7 @@ class ExportWorker(QThread):
                 snapshot_fr, left_h_fr, right_h_fr, lambda s: s, lambda s: s
             )
             out_fr = _normalize_for_paste(out_fr)
-            with open(self.path_fr, "w", encoding="utf-8") as f:
+            with open(self.path_fr, "w", encoding="utf-8", newline="\n") as f:
                 f.write(out_fr)
 
             result["ok"] = True
@@ -754,6 +813,136 @@ def _sanitize_value_html(html: str) -> str:
     html = re.sub(r'<span(?:\sstyle="")?\s*>(.*?)</span>', r'\1', html, flags=re.I|re.S)
     return html
 
+# Optional DFA regex engine (google-re2 via pyre2) for the snapshot scan:
+# linear worst case, no backtracking. Falls back to stdlib re. The pattern
+# stays RE2-compatible (no backreferences, no lookaround).
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = re
+
+_RE_SNAPSHOT = re_fast.compile(r'<!--\s*SPECS_EDITOR_v(\d+)\s*(\{.*\})\s*-->', re.DOTALL)
+
+# Upper bound on parsed rows; a hostile file with millions of fake <tr> tags
+# must not freeze the UI thread.
+MAX_ROWS = 50000
+
+
+def _fast_strip(s: str) -> str:
+    # Skip the strip() when the capture already has clean edges (common case).
+    return s if s and not s[0].isspace() and not s[-1].isspace() else s.strip()
+
+
+class _SpecsRowParser(HTMLParser):
+    """
+    Single-pass tokenizer for the exported specs table. Emits one row tuple
+    per </tr> instead of running per-pattern regex scans over the document:
+    headers as plain text, ("__SECTION__"/"__CAT__", title) for title rows,
+    (key_plain, value_html) for kv rows. Cell HTML is reconstructed verbatim
+    (raw tag text, entities kept) so value formatting round-trips.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.headers: list[str] = []
+        self.rows: list[tuple[str, str]] = []
+        self.truncated = False
+        self._in_thead = False
+        self._in_tbody = False
+        self._in_tr = False
+        self._tr_class = ""
+        self._cells: list[tuple[str, str]] = []  # (tag, raw_inner_html)
+        self._cell: list[str] | None = None
+        self._cell_tag = ""
+        self._cell_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._cell is not None:
+            self._cell.append(self.get_starttag_text())
+            if tag == self._cell_tag:
+                self._cell_depth += 1
+            return
+        if tag == "thead":
+            self._in_thead = True
+        elif tag == "tbody":
+            self._in_tbody = True
+        elif tag == "tr":
+            self._in_tr = True
+            self._tr_class = dict(attrs).get("class") or ""
+            self._cells = []
+        elif tag in ("th", "td") and self._in_tr:
+            self._cell = []
+            self._cell_tag = tag
+            self._cell_depth = 0
+
+    def handle_startendtag(self, tag, attrs):
+        # Keep self-closing tags (<br />) verbatim; the default implementation
+        # would emit a bogus </br> via handle_endtag.
+        if self._cell is not None:
+            self._cell.append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        if self._cell is not None:
+            if tag == self._cell_tag:
+                if self._cell_depth:
+                    self._cell_depth -= 1
+                    self._cell.append(f"</{tag}>")
+                    return
+                self._cells.append((self._cell_tag, "".join(self._cell)))
+                self._cell = None
+                return
+            self._cell.append(f"</{tag}>")
+            return
+        if tag == "thead":
+            self._in_thead = False
+        elif tag == "tbody":
+            self._in_tbody = False
+        elif tag == "tr" and self._in_tr:
+            self._in_tr = False
+            self._emit_row(self._cells)
+            self._cells = []
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def handle_entityref(self, name):
+        if self._cell is not None:
+            self._cell.append(f"&{name};")
+
+    def handle_charref(self, name):
+        if self._cell is not None:
+            self._cell.append(f"&#{name};")
+
+    def _emit_row(self, cells):
+        if self._in_thead:
+            if not self.headers and len(cells) >= 2:
+                self.headers = [_html.unescape(_fast_strip(c[1])) for c in cells[:2]]
+            return
+        if not self._in_tbody or self.truncated:
+            return
+        if len(self.rows) >= MAX_ROWS:
+            self.rows.append(("__SECTION__", f"[Abgeschnitten bei {MAX_ROWS} Zeilen]"))
+            self.truncated = True
+            return
+        tr_classes = self._tr_class.split()
+        if "section" in tr_classes:
+            title = _html.unescape(_fast_strip(cells[0][1])) if cells else ""
+            self.rows.append(("__SECTION__", title))
+            return
+        if "cat" in tr_classes:
+            title = _html.unescape(_fast_strip(cells[0][1])) if cells else ""
+            self.rows.append(("__CAT__", title))
+            return
+        key_html = next((c[1] for c in cells if c[0] == "th"), None)
+        val_html = next((c[1] for c in cells if c[0] == "td"), None)
+        if key_html is not None and val_html is not None:
+            self.rows.append((
+                _html.unescape(_fast_strip(key_html)),
+                _fast_strip(val_html),
+            ))
+
+
 def _scrape_log(msg: str):
     try:
         os.makedirs("output", exist_ok=True)
@@ -828,6 +1017,14 @@ def _clean_scraped_value(raw_text: str) -> str:
 class RichTextArea(QTextEdit):
     confirm = Signal()   # Ctrl+Enter
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Reusable merge formats, one per property so a toggle never drags
+        # stale state from another action into mergeCurrentCharFormat().
+        self._fmt_weight = QTextCharFormat()
+        self._fmt_italic = QTextCharFormat()
+        self._fmt_color = QTextCharFormat()
+
     def keyPressEvent(self, e):
         if (e.key() in (Qt.Key_Return, Qt.Key_Enter)) and (e.modifiers() & Qt.ControlModifier):
             self.confirm.emit(); return
@@ -846,19 +1043,17 @@ class RichTextArea(QTextEdit):
         self.insertPlainText(_normalize_for_paste(cb.text() or ""))  # <— add
 
     def toggle_bold(self):
-        fmt = QTextCharFormat()
-        fmt.setFontWeight(QFont.Bold if self.fontWeight() != QFont.Bold else QFont.Normal)
-        self.mergeCurrentCharFormat(fmt)
+        self._fmt_weight.setFontWeight(QFont.Bold if self.fontWeight() != QFont.Bold else QFont.Normal)
+        self.mergeCurrentCharFormat(self._fmt_weight)
 
     def toggle_italic(self):
-        fmt = QTextCharFormat()
-        fmt.setFontItalic(not self.fontItalic())
-        self.mergeCurrentCharFormat(fmt)
+        self._fmt_italic.setFontItalic(not self.fontItalic())
+        self.mergeCurrentCharFormat(self._fmt_italic)
 
     def pick_color(self):
         c = QColorDialog.getColor(self.textColor(), self, "Textfarbe wählen")
         if c.isValid():
-            fmt = QTextCharFormat(); fmt.setForeground(c); self.mergeCurrentCharFormat(fmt)
+            self._fmt_color.setForeground(c); self.mergeCurrentCharFormat(self._fmt_color)
 
     def toggle_bullets(self):
         cur = self.textCursor()
@@ -954,14 +1149,11 @@ class EntryRow(QWidget):
         self.val = AutoGrowTextEdit(min_lines=3, max_lines=12)
         self.val.setAcceptRichText(True)
 
-        if value_html:
-            # If we were given full HTML (with <html>), keep it intact.
-            s = value_html.strip().lower()
-            if s.startswith("<html"):
-                self.val.setHtml(value_html)
-            else:
-                # Inner-fragment case: wrap lightly so Qt parses it as rich text
-                self.val.setHtml(f"<div>{value_html}</div>")
+        # Lazy: keep the captured HTML as a string and only build the
+        # rich-text document when the row is first shown (showEvent) or its
+        # value is read. Loading a large file no longer pays the HTML-to-
+        # QTextDocument cost up front for every row.
+        self._pending_html = value_html or None
 
         self.val.heightChanged.connect(self._sync_key_height)
         self._sync_key_height(self.val.height())
@@ -1002,20 +1194,38 @@ class EntryRow(QWidget):
     def _sync_key_height(self, h: int):
         self.key.setFixedHeight(h)
 
+    def _flush_pending_html(self):
+        value_html = self._pending_html
+        if value_html is None:
+            return
+        self._pending_html = None
+        # If we were given full HTML (with <html>), keep it intact.
+        s = value_html.strip().lower()
+        if s.startswith("<html"):
+            self.val.setHtml(value_html)
+        else:
+            # Inner-fragment case: wrap lightly so Qt parses it as rich text
+            self.val.setHtml(f"<div>{value_html}</div>")
+
+    def showEvent(self, e):
+        self._flush_pending_html()
+        super().showEvent(e)
+
     def key_plain(self) -> str:
         return self.key.text().strip()
 
     def val_html(self) -> str:
+        self._flush_pending_html()
         cur = self.val.textCursor();
         cur.select(QTextCursor.Document)
         frag = cur.selection().toHtml()
         start = frag.find("<body")
         if start == -1:
-            return _escape_html(self.val.toPlainText()).replace("\n", "<br />")
+            return _escape_html_br(self.val.toPlainText())
         start = frag.find(">", start)
         end = frag.rfind("</body>")
         if start == -1 or end == -1:
-            return _escape_html(self.val.toPlainText()).replace("\n", "<br />")
+            return _escape_html_br(self.val.toPlainText())
         inner = frag[start + 1:end].strip()
         return _sanitize_value_html(inner)  # <— apply the cleaner
 
@@ -1252,7 +1462,7 @@ class ScrapeWorker(QThread):
                             li_html = "".join(f"<li>{_escape_html(it)}</li>" for it in items)
                             value_html = f"<ul>{li_html}</ul>"
                         else:
-                            value_html = _escape_html(clean_val).replace("\n", "<br />")
+                            value_html = _escape_html_br(clean_val)
                         rows.append(("kv", key, value_html))
 
                 self.progress.emit(i + 1, total)
@@ -1275,24 +1485,24 @@ class MainWindow(QMainWindow):
     updateFound = Signal(object)
     def __init__(self):
         super().__init__()
+        # Suppress intermediate repaints while the whole UI is assembled.
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(APP_TITLE)
-        self.setWindowIcon(QIcon(resource_path("icons\\icon_gra.ico")))
+        self.setWindowIcon(_icon("icons/icon_gra.ico"))
 
         # Start auto-update check in background (silent)
         self._start_update_check()
         self.resize(1120, 860)
-        try_set_modern_app_font()
-        apply_brand_theme(QApplication.instance())
 
         # --- Icons (row actions + toolbar) ---
         self.icons = {
-            "bold"  : QIcon(resource_path("icons/bold.svg")),
-            "italic": QIcon(resource_path("icons/italic.svg")),
-            "color" : QIcon(resource_path("icons/color.svg")),
-            "list"  : QIcon(resource_path("icons/list.svg")),
-            "up"    : QIcon(resource_path("icons/up_arrow.svg")),
-            "down"  : QIcon(resource_path("icons/down_arrow.svg")),
-            "delete": QIcon(resource_path("icons/bin.svg")),
+            "bold"  : _icon("icons/bold.svg"),
+            "italic": _icon("icons/italic.svg"),
+            "color" : _icon("icons/color.svg"),
+            "list"  : _icon("icons/list.svg"),
+            "up"    : _icon("icons/up_arrow.svg"),
+            "down"  : _icon("icons/down_arrow.svg"),
+            "delete": _icon("icons/bin.svg"),
         }
 
         # --- Actions (format) ---
@@ -1404,7 +1614,7 @@ class MainWindow(QMainWindow):
         robo_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignBottom)
         rp = resource_path("icons/robot_with_bubble_100px.png")
         if os.path.exists(rp):
-            robo_label.setPixmap(QPixmap(rp))
+            robo_label.setPixmap(_cached_pixmap("robot_bubble", "icons/robot_with_bubble_100px.png"))
         rp_layout.addStretch(1)
         rp_layout.addWidget(robo_label, 0, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter)
 
@@ -1512,6 +1722,10 @@ class MainWindow(QMainWindow):
         self.key_in.setAlignment(Qt.AlignVCenter | Qt.AlignRight)
         self.val_in = PlainPasteTextEdit(min_lines=3, max_lines=12)
         self.val_in.setPlaceholderText("Wert Eingeben (Ctrl+Enter bestätigt)")
+        # Track the last focused rich-text widget via the focusChanged signal
+        # instead of polling QApplication.focusWidget() on every format action.
+        self._last_rich = self.val_in
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
         self.header_in = PlainPasteLineEdit()
         self.header_in.setPlaceholderText("Abschnittstitel eingeben")
         hf = self.header_in.font(); hf.setBold(True); self.header_in.setFont(hf)
@@ -1617,6 +1831,7 @@ class MainWindow(QMainWindow):
         self.updateFound.connect(self._show_update_dialog_slot)
         self.statusBar().showMessage("Bereit")
         QTimer.singleShot(0, self._ensure_openai_key_state)
+        self.setUpdatesEnabled(True)
 
     # ---------- Auto-Update Methods ----------
     def _ensure_openai_key_state(self):
@@ -1933,9 +2148,12 @@ class MainWindow(QMainWindow):
         return holder
 
     # Formatting targeting active rich text
+    def _on_focus_changed(self, old, new):
+        if isinstance(new, QTextEdit):
+            self._last_rich = new
+
     def current_text_widget(self):
-        w = QApplication.focusWidget()
-        return w if isinstance(w, QTextEdit) else self.val_in
+        return self._last_rich
 
     def on_bold(self):
         w = self.current_text_widget()
@@ -2067,6 +2285,10 @@ class MainWindow(QMainWindow):
     # Row actions
     def _row_delete(self, row: EntryRow):
         if row in self.rows_widgets:
+            # Don't leave _last_rich pointing at an editor we're destroying;
+            # the next toolbar action would hit a dead C++ object.
+            if self._last_rich is getattr(row, "val", None):
+                self._last_rich = self.val_in
             self.rows_widgets.remove(row)
             row.setParent(None); row.deleteLater()
 
@@ -2103,9 +2325,7 @@ class MainWindow(QMainWindow):
         right_h = self.hdr_right.text().strip() or DEFAULT_HEADER_RIGHT
 
         # --- Save dialog ---
-        base = self.title_in.text().strip() or DEFAULT_EXPORT_TITLE
-        base = "".join(ch if ch.isalnum() or ch in (" ", "-", "_") else "_" for ch in base).strip()
-        base = "_".join(base.split()) or DEFAULT_EXPORT_TITLE
+        base = _sanitize_filename(self.title_in.text().strip() or DEFAULT_EXPORT_TITLE)
         default_name = f"{base}.txt"
         desktop = QStandardPaths.writableLocation(QStandardPaths.DesktopLocation) or ""
         default_path = os.path.join(desktop, default_name) if desktop else default_name
@@ -2129,7 +2349,7 @@ class MainWindow(QMainWindow):
             try:
                 out = _build_table_from_snapshot(snapshot, left_h, right_h, lambda s: s, lambda s: s)
                 out = _normalize_for_paste(out)
-                with open(path, "w", encoding="utf-8") as f:
+                with open(path, "w", encoding="utf-8", newline="\n") as f:
                     f.write(out)
                 self.statusBar().showMessage(f"Gespeichert unter: {path}", 4000)
                 dlg = QDialog(self)
@@ -2591,15 +2811,12 @@ class MainWindow(QMainWindow):
         anim.finished.connect(notif.deleteLater)
         anim.start()
 
-    def _parse_specs_file(self, content: str):
+    def _try_parse_snapshot(self, content: str):
         """
-        Returns: (left_header, right_header, rows)
-        rows is a list of tuples: (key_plain, value_html)
-        1) Prefer embedded JSON snapshot (for old files).
-        2) Otherwise reverse from the <table class="specs"> in order.
+        Fast path: files saved by this editor carry an embedded JSON snapshot.
+        Returns (left_header, right_header, rows) or None if no usable snapshot.
         """
-        # 1) Embedded JSON? (kept for backward compatibility)
-        m = re.search(r'<!--\s*SPECS_EDITOR_v(\d+)\s*(\{.*\})\s*-->', content, re.DOTALL)
+        m = _RE_SNAPSHOT.search(content)
         if m:
             try:
                 ver = int(m.group(1))
@@ -2622,57 +2839,28 @@ class MainWindow(QMainWindow):
                 return h_left, h_right, rows
             except Exception:
                 pass
+        return None
 
-        # 2) Fallback: parse the exported table in document order
-        # headers
-        mh = re.search(
-            r'<thead>.*?<tr>\s*<th>(.*?)</th>\s*<th>(.*?)</th>\s*</tr>.*?</thead>',
-            content, re.DOTALL | re.IGNORECASE
-        )
-        if mh:
-            h_left = _html.unescape(mh.group(1).strip())
-            h_right = _html.unescape(mh.group(2).strip())
+    def _parse_specs_html(self, content: str):
+        """
+        Fallback: reverse (left_header, right_header, rows) from the exported
+        <table class="specs"> in document order via a single linear
+        _SpecsRowParser pass (no per-pattern regex scans, no backtracking).
+        """
+        parser = _SpecsRowParser()
+        # Feed in chunks so parsing starts before the tail is tokenized and
+        # the truncation guard can stop early on hostile input.
+        for i in range(0, len(content), 65536):
+            parser.feed(content[i:i + 65536])
+            if parser.truncated:
+                break
+        parser.close()
+
+        if len(parser.headers) >= 2:
+            h_left, h_right = parser.headers[0], parser.headers[1]
         else:
             h_left, h_right = DEFAULT_HEADER_LEFT, DEFAULT_HEADER_RIGHT
-
-        # tbody
-        mt = re.search(r'<tbody>(.*?)</tbody>', content, re.DOTALL | re.IGNORECASE)
-        rows = []
-        if mt:
-            tbody = mt.group(1)
-            # iterate <tr> in order and decide per row
-            for mtr in re.finditer(r'<tr[^>]*>(.*?)</tr>', tbody, re.DOTALL | re.IGNORECASE):
-                tr_html = mtr.group(0)
-
-                # section/header row?
-                if re.search(r'class="[^"]*\bsection\b[^"]*"', tr_html, re.IGNORECASE):
-                    mtitle = re.search(
-                        r'<th[^>]*class="[^"]*\bsection\b[^"]*"[^>]*colspan="2"[^>]*>(.*?)</th>',
-                        tr_html, re.DOTALL | re.IGNORECASE
-                    )
-                    title = _html.unescape(mtitle.group(1).strip()) if mtitle else ""
-                    rows.append(("__SECTION__", title))
-                    continue
-
-                # category row?
-                if re.search(r'class="[^"]*\bcat\b[^"]*"', tr_html, re.IGNORECASE):
-                    mtitle = re.search(
-                        r'<th[^>]*class="[^"]*\bcategory\b[^"]*"[^>]*colspan="2"[^>]*>(.*?)</th>',
-                        tr_html, re.DOTALL | re.IGNORECASE
-                    )
-                    title = _html.unescape(mtitle.group(1).strip()) if mtitle else ""
-                    rows.append(("__CAT__", title))
-                    continue
-
-                # kv row
-                mk = re.search(r'<th>(.*?)</th>', tr_html, re.DOTALL | re.IGNORECASE)
-                mv = re.search(r'<td>(.*?)</td>', tr_html, re.DOTALL | re.IGNORECASE)
-                if mk and mv:
-                    key_plain = _html.unescape(mk.group(1).strip())
-                    value_html = (mv.group(1) or "").strip()
-                    rows.append((key_plain, value_html))
-
-        return h_left, h_right, rows
+        return h_left, h_right, parser.rows
 
     def load_from_file(self):
         """
@@ -2692,13 +2880,19 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Ladefehler", str(e))
             return
 
-        left_h, right_h, rows = self._parse_specs_file(content)
+        # Snapshot first (the common case); only regex-parse the HTML when
+        # the file carries no usable snapshot.
+        parsed = self._try_parse_snapshot(content)
+        if parsed is None:
+            parsed = self._parse_specs_html(content)
+        left_h, right_h, rows = parsed
 
         # Set headers
         self.hdr_left.setText(left_h or DEFAULT_HEADER_LEFT)
         self.hdr_right.setText(right_h or DEFAULT_HEADER_RIGHT)
 
-        # Clear current rows
+        # Clear current rows (and the focus cache, which may reference one)
+        self._last_rich = self.val_in
         self.rows_widgets.clear()
         # Remove all layout items
         while self.rows_v.count():
@@ -2708,20 +2902,24 @@ class MainWindow(QMainWindow):
                 w.setParent(None)
 
         # Re-add rows + tail spacer so rows pin to top
+        # Hoist attribute lookups out of the loop; it runs O(rows) times.
+        icons = self.icons
+        rows_widgets_append = self.rows_widgets.append
+        rows_v_addWidget = self.rows_v.addWidget
         for key_plain, value_html in rows:
             if key_plain == "__SECTION__":
-                row = HeaderRow(value_html, self.icons)
+                row = HeaderRow(value_html, icons)
             elif key_plain == "__CAT__":
-                row = CategoryRow(value_html, self.icons)  # value_html holds the title here
+                row = CategoryRow(value_html, icons)  # value_html holds the title here
             else:
-                row = EntryRow(key_plain, value_html, self.icons)
+                row = EntryRow(key_plain, value_html, icons)
             row.requestDelete.connect(self._row_delete)
             row.requestMoveUp.connect(self._row_move_up)
             row.requestMoveDown.connect(self._row_move_down)
             if hasattr(row, "requestFocusToKey"):
                 row.requestFocusToKey.connect(lambda: self.key_in.setFocus(Qt.OtherFocusReason))
-            self.rows_widgets.append(row)
-            self.rows_v.addWidget(row)
+            rows_widgets_append(row)
+            rows_v_addWidget(row)
 
         # Focus the input row ready for edits
         self.key_in.setFocus()
@@ -12,11 +12,15 @@
 
 import sys
 import os
+import re
+import functools
+from io import StringIO
 
 from PySide6.QtCore import Qt, QSize, QTimer
 from PySide6.QtGui import (
     QAction, QKeySequence, QTextCharFormat, QTextCursor, QTextListFormat,
-    QTextTableFormat, QFont, QColor, QGuiApplication, QFontDatabase, QClipboard, QPalette, QIcon, QPixmap
+    QTextTableFormat, QFont, QColor, QGuiApplication, QFontDatabase, QClipboard, QPalette, QIcon,
+    QPixmap, QPixmapCache
 )
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QToolBar, QVBoxLayout, QHBoxLayout,
@@ -43,11 +47,35 @@ table.specs {width:100%; border-collapse:collapse; font-family:Arial, Helvetica,
       ul {margin:6px 0 6px 18px; padding:0;}</style>
 """.strip()
 
+# Export HTML skeleton, frozen at import time; only the row interiors are
+# formatted per export.
+_TABLE_HEAD = (
+    '<table border="1" class="specs">\n\t<thead>\n\t\t<tr>\n'
+    '\t\t\t<th>{lh}</th>\n\t\t\t<th>{rh}</th>\n\t\t</tr>\n\t</thead>\n\t<tbody>\n'
+)
+_TABLE_TAIL = '\t</tbody>\n</table>'
+_ROW_TMPL = '\t\t<tr>\n\t\t\t<th>{k}</th>\n\t\t\t<td>{v}</td>\n\t\t</tr>\n'
+
 def resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller .exe """
     base_path = getattr(sys, '_MEIPASS', os.path.abspath("."))
     return os.path.join(base_path, relative_path)
 
+
+@functools.lru_cache(maxsize=None)
+def _icon(path):
+    """QIcon per resource path, loaded from disk at most once."""
+    return QIcon(resource_path(path))
+
+
+def _cached_pixmap(key, path):
+    """Decode a static image once and serve later requests from QPixmapCache."""
+    pm = QPixmap()
+    if not QPixmapCache.find(key, pm):
+        pm.load(resource_path(path))
+        QPixmapCache.insert(key, pm)
+    return pm
+
 def try_set_modern_app_font():
     """Prefer Aptos if installed; otherwise fall back to a clean system UI font (Qt 6-safe static API)."""
     families = set(QFontDatabase.families())
@@ -235,22 +263,27 @@ def print_widget_sizes(window, widgets):
 
 class RichTextArea(QTextEdit):
     """Rich text control (no raw HTML shown)."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Reusable merge formats, one per property so a toggle never drags
+        # stale state from another action into mergeCurrentCharFormat().
+        self._fmt_weight = QTextCharFormat()
+        self._fmt_italic = QTextCharFormat()
+        self._fmt_color = QTextCharFormat()
+
     def toggle_bold(self):
-        fmt = QTextCharFormat()
-        fmt.setFontWeight(QFont.Bold if self.fontWeight() != QFont.Bold else QFont.Normal)
-        self.mergeCurrentCharFormat(fmt)
+        self._fmt_weight.setFontWeight(QFont.Bold if self.fontWeight() != QFont.Bold else QFont.Normal)
+        self.mergeCurrentCharFormat(self._fmt_weight)
 
     def toggle_italic(self):
-        fmt = QTextCharFormat()
-        fmt.setFontItalic(not self.fontItalic())
-        self.mergeCurrentCharFormat(fmt)
+        self._fmt_italic.setFontItalic(not self.fontItalic())
+        self.mergeCurrentCharFormat(self._fmt_italic)
 
     def pick_color(self):
         c = QColorDialog.getColor(self.textColor(), self, "Choose text color")
         if c.isValid():
-            fmt = QTextCharFormat()
-            fmt.setForeground(c)
-            self.mergeCurrentCharFormat(fmt)
+            self._fmt_color.setForeground(c)
+            self.mergeCurrentCharFormat(self._fmt_color)
 
     def toggle_bullets(self):
         cur = self.textCursor()
@@ -292,8 +325,9 @@ class SpecsTableEditor(RichTextArea):
         self._write_cell(0, 0, left_header, header=True)
         self._write_cell(0, 1, right_header, header=True)
 
-    def _write_cell(self, row, col, text, header=False, bold=False):
-        cell = self._table.cellAt(row, col)
+    def _write_cell(self, row, col, text, header=False, bold=False, cell=None):
+        if cell is None:
+            cell = self._table.cellAt(row, col)
         cur = cell.firstCursorPosition()
         cur.select(QTextCursor.BlockUnderCursor)
         cur.removeSelectedText()
@@ -305,20 +339,26 @@ class SpecsTableEditor(RichTextArea):
 
     def add_row(self, key_text, value_fragment_html):
         self.ensure_table()
-        row_idx = self._table.rows()
-        self._table.insertRows(row_idx, 1)
-
-        # Key: plain text, but visually bold by default in the editor
-        self._write_cell(row_idx, 0, key_text, header=False, bold=True)
-
-        # Value: rich fragment (preserve bullets/bold/color/newlines)
-        start = self._table.cellAt(row_idx, 1).firstCursorPosition()
         cur = self.textCursor()
-        cur.setPosition(start.position())
-        if not value_fragment_html.strip():
-            cur.insertText("")
-        else:
-            cur.insertHtml(value_fragment_html)
+        # One edit block: row insert + both cell writes become a single undo
+        # record and layout pass.
+        cur.beginEditBlock()
+        try:
+            row_idx = self._table.rows()
+            self._table.insertRows(row_idx, 1)
+
+            # Key: plain text, but visually bold by default in the editor
+            self._write_cell(row_idx, 0, key_text, header=False, bold=True)
+
+            # Value: rich fragment (preserve bullets/bold/color/newlines)
+            start = self._table.cellAt(row_idx, 1).firstCursorPosition()
+            cur.setPosition(start.position())
+            if not value_fragment_html.strip():
+                cur.insertText("")
+            else:
+                cur.insertHtml(value_fragment_html)
+        finally:
+            cur.endEditBlock()
 
     def delete_selected_row(self):
         if not self._table:
@@ -346,72 +386,99 @@ class SpecsTableEditor(RichTextArea):
         if target < 1 or target >= self._table.rows():
             return
 
-        def get_plain(r, c):
-            return self._table.cellAt(r, c).firstCursorPosition().block().text()
-
-        def set_plain(r, c, text, make_bold=False):
-            self._write_cell(r, c, text, header=False, bold=make_bold)
-
-        a_left = get_plain(row, 0)
-        a_right = get_plain(row, 1)
-        b_left = get_plain(target, 0)
-        b_right = get_plain(target, 1)
-
-        set_plain(row, 0, b_left, make_bold=True)
-        set_plain(row, 1, b_right)
-        set_plain(target, 0, a_left, make_bold=True)
-        set_plain(target, 1, a_right)
+        # Resolve each involved cell once; cellAt + firstCursorPosition are
+        # binding crossings we do not want 4x per cell.
+        table = self._table
+        cell_a0 = table.cellAt(row, 0)
+        cell_a1 = table.cellAt(row, 1)
+        cell_b0 = table.cellAt(target, 0)
+        cell_b1 = table.cellAt(target, 1)
+
+        a_left = cell_a0.firstCursorPosition().block().text()
+        a_right = cell_a1.firstCursorPosition().block().text()
+        b_left = cell_b0.firstCursorPosition().block().text()
+        b_right = cell_b1.firstCursorPosition().block().text()
+
+        # One edit block: a single undo record and layout pass for the swap.
+        cur.beginEditBlock()
+        try:
+            self._write_cell(row, 0, b_left, bold=True, cell=cell_a0)
+            self._write_cell(row, 1, b_right, cell=cell_a1)
+            self._write_cell(target, 0, a_left, bold=True, cell=cell_b0)
+            self._write_cell(target, 1, a_right, cell=cell_b1)
+        finally:
+            cur.endEditBlock()
 
-        self.setTextCursor(self._table.cellAt(target, 0).firstCursorPosition())
+        self.setTextCursor(table.cellAt(target, 0).firstCursorPosition())
 
     def extract_headers_and_rows_as_html(self):
         """Returns (left_header, right_header, rows_as_html) preserving value formatting."""
-        if not self._table or self._table.rows() < 1:
+        table = self._table
+        if not table or table.rows() < 1:
             return DEFAULT_HEADER_LEFT, DEFAULT_HEADER_RIGHT, []
-        h_left = self._table.cellAt(0, 0).firstCursorPosition().block().text()
-        h_right = self._table.cellAt(0, 1).firstCursorPosition().block().text()
+        h_left = table.cellAt(0, 0).firstCursorPosition().block().text()
+        h_right = table.cellAt(0, 1).firstCursorPosition().block().text()
         rows = []
-        for r in range(1, self._table.rows()):
-            key_plain = self._table.cellAt(r, 0).firstCursorPosition().block().text()
-            val_html = _cell_inner_html(self._table, r, 1)
+        # One cursor reused for every value cell; constructing a QTextCursor
+        # per cell crosses the binding once per row for nothing.
+        cur = QTextCursor(self.document())
+        for r in range(1, table.rows()):
+            key_plain = table.cellAt(r, 0).firstCursorPosition().block().text()
+            val_html = _cell_inner_html(table, r, 1, cur)
             rows.append((key_plain, val_html))
         return h_left, h_right, rows
 
 
+_BODY_RE = re.compile(r"<body[^>]*>(.*)</body>", re.DOTALL)
+
+
 def _extract_inner_html_from_selection(sel_cursor: QTextCursor) -> str:
     """Extract inner <body>… content from a QTextDocumentFragment's HTML, or fallback to escaped text with <br>."""
     frag = sel_cursor.selection().toHtml()
-    start_tag = "<body"
-    start = frag.find(start_tag)
-    if start == -1:
-        return _escape_html(sel_cursor.selection().toPlainText()).replace("\n", "<br />")
-    start = frag.find(">", start)
-    end = frag.rfind("</body>")
-    if start == -1 or end == -1:
-        return _escape_html(sel_cursor.selection().toPlainText()).replace("\n", "<br />")
-    inner = frag[start + 1:end].strip()
-    return inner
-
-
-def _cell_inner_html(table, r, c) -> str:
-    start = table.cellAt(r, c).firstCursorPosition()
-    end = table.cellAt(r, c).lastCursorPosition()
-    cur = QTextCursor(start.document())
+    # One regex scan instead of two find() + one rfind() pass over the
+    # multi-KB document toHtml() produces.
+    m = _BODY_RE.search(frag)
+    if m:
+        return m.group(1).strip()
+    return _escape_html_br(sel_cursor.selection().toPlainText())
+
+
+def _cell_inner_html(table, r, c, cur=None) -> str:
+    cell = table.cellAt(r, c)
+    start = cell.firstCursorPosition()
+    if cur is None:
+        cur = QTextCursor(start.document())
     cur.setPosition(start.position())
-    cur.setPosition(end.position(), QTextCursor.KeepAnchor)
+    cur.setPosition(cell.lastCursorPosition().position(), QTextCursor.KeepAnchor)
     return _extract_inner_html_from_selection(cur)
 
 
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
 def _escape_html(text: str) -> str:
-    return (text.replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace('"', "&quot;"))
+    # Single C-level pass instead of four chained replace() scans.
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+_HTML_ESCAPE_BR_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "\n": "<br />"}
+)
+
+
+def _escape_html_br(text: str) -> str:
+    # Escape plus newline -> <br /> in the same single pass.
+    return text.translate(_HTML_ESCAPE_BR_TABLE)
+
+
+# \w keeps unicode letters (umlauts in German titles) like isalnum() did.
+_FNAME_BAD_RE = re.compile(r"[^\w\s-]+")
+_FNAME_WS_RE = re.compile(r"\s+")
 
 
 def _sanitize_filename(name: str) -> str:
-    valid = "".join(ch if ch.isalnum() or ch in (" ", "-", "_") else "_" for ch in name).strip()
-    return "_".join(valid.split()) or DEFAULT_EXPORT_TITLE
+    cleaned = _FNAME_WS_RE.sub("_", _FNAME_BAD_RE.sub("_", name).strip())
+    return cleaned or DEFAULT_EXPORT_TITLE
 
 
 def make_separator() -> QFrame:
@@ -436,8 +503,10 @@ def add_icon_action(toolbar, icon: QIcon, tooltip: str, shortcut: QKeySequence |
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        # Suppress intermediate repaints while the whole UI is assembled.
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(APP_TITLE)
-        self.setWindowIcon(QIcon(resource_path("icons\\icon_gra.ico")))
+        self.setWindowIcon(_icon("icons/icon_gra.ico"))
         self.resize(1040, 820)  # a bit larger by default for breathing room
         try_set_modern_app_font()
         apply_brand_theme(QApplication.instance())
@@ -454,10 +523,10 @@ class MainWindow(QMainWindow):
         tb.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)  # fill vertical space
 
         # Load icons
-        bold_icon = QIcon(resource_path("icons/bold.svg"))
-        italic_icon = QIcon(resource_path("icons/italic.svg"))
-        color_icon = QIcon(resource_path("icons/color.svg"))
-        list_icon = QIcon(resource_path("icons/list.svg"))
+        bold_icon = _icon("icons/bold.svg")
+        italic_icon = _icon("icons/italic.svg")
+        color_icon = _icon("icons/color.svg")
+        list_icon = _icon("icons/list.svg")
 
         # Helper: a vertical stretch widget for the toolbar
         def _vstretch():
@@ -490,14 +559,13 @@ class MainWindow(QMainWindow):
         act_bullets.setShortcut("Ctrl+Shift+8")
         act_bullets.triggered.connect(self.on_bullets)
 
-        # Add N+1 stretches around N actions -> equal vertical spacing
+        # Two stretches (top/bottom) center the group; toolbar spacing
+        # handles the gaps between actions instead of per-gap widgets.
+        tb.setStyleSheet("QToolBar#formatToolbar { spacing: 20px; }")
         tb.addWidget(_vstretch())
         tb.addAction(act_bold)
-        tb.addWidget(_vstretch())
         tb.addAction(act_italic)
-        tb.addWidget(_vstretch())
         tb.addAction(act_color)
-        tb.addWidget(_vstretch())
         tb.addAction(act_bullets)
         tb.addWidget(_vstretch())
 
@@ -620,21 +688,29 @@ class MainWindow(QMainWindow):
         outer.addWidget(specs_label)
 
         self.specs = SpecsTableEditor()
+        # Track the last focused rich-text widget via the focusChanged signal
+        # instead of polling QApplication.focusWidget() on every format action.
+        self._last_rich = self.specs
+        QApplication.instance().focusChanged.connect(self._on_focus_changed)
         spec_layout = QHBoxLayout()
         spec_layout.setSpacing(12)
 
         image_layout = QVBoxLayout()
         image_layout.setSpacing(6)
         robot_label = QLabel(self)
-        robot_image = QPixmap('icons\\robot_gra_100px.png')
-        robot_label.setPixmap(robot_image)
         robot_label.setAlignment(Qt.AlignHCenter | Qt.AlignBottom)
 
         bubble_label = QLabel(self)
-        bubble_image = QPixmap('icons\\speech_bubble.png')
-        bubble_label.setPixmap(bubble_image)
         bubble_label.setAlignment(Qt.AlignHCenter)
 
+        # Decode the decorative PNGs after the window is up; they are not
+        # needed for first paint. Also route them through resource_path so
+        # the PyInstaller build finds them.
+        def _load_decorations():
+            robot_label.setPixmap(_cached_pixmap("robot", "icons/robot_gra_100px.png"))
+            bubble_label.setPixmap(_cached_pixmap("bubble", "icons/speech_bubble.png"))
+        QTimer.singleShot(0, _load_decorations)
+
         image_layout.addStretch()
         image_layout.addWidget(bubble_label)
         image_layout.addWidget(robot_label)
@@ -661,24 +737,31 @@ class MainWindow(QMainWindow):
         ops.addWidget(delete)
         outer.addLayout(ops)
 
-        # Ensure table exists
-        self.specs.ensure_table(DEFAULT_HEADER_LEFT, DEFAULT_HEADER_RIGHT)
+        # Build the empty preview table after first paint; add_row calls
+        # ensure_table itself, so this only matters for the initial render.
+        QTimer.singleShot(0, lambda: self.specs.ensure_table(DEFAULT_HEADER_LEFT, DEFAULT_HEADER_RIGHT))
+
+        # Debug sizes (skipped entirely under python -O)
+        if __debug__:
+            print_widget_sizes(self, {
+                "Key Input"         : self.key_in,
+                "Value input"       : self.val_in,
+                "paste key"         : paste_key,
+                "paste val"         : paste_val,
+                "hinz button"       : add_btn,
+                "exportieren button": export_btn_sidecar,
+                "Vorschau"          : self.specs
+            })
 
-        # Debug sizes (optional)
-        print_widget_sizes(self, {
-            "Key Input"         : self.key_in,
-            "Value input"       : self.val_in,
-            "paste key"         : paste_key,
-            "paste val"         : paste_val,
-            "hinz button"       : add_btn,
-            "exportieren button": export_btn_sidecar,
-            "Vorschau"          : self.specs
-        })
+        self.setUpdatesEnabled(True)
 
     # Formatting targeting whichever rich text widget has focus (Value editor or table)
+    def _on_focus_changed(self, old, new):
+        if isinstance(new, QTextEdit):
+            self._last_rich = new
+
     def current_text_widget(self):
-        w = QApplication.focusWidget()
-        return w if isinstance(w, QTextEdit) else self.specs
+        return self._last_rich
 
     def on_bold(self):
         w = self.current_text_widget()
@@ -711,8 +794,13 @@ class MainWindow(QMainWindow):
         left = self.h_left.text().strip() or DEFAULT_HEADER_LEFT
         right = self.h_right.text().strip() or DEFAULT_HEADER_RIGHT
         self.specs.ensure_table(left, right)
-        self.specs._write_cell(0, 0, left, header=True)
-        self.specs._write_cell(0, 1, right, header=True)
+        cur = self.specs.textCursor()
+        cur.beginEditBlock()
+        try:
+            self.specs._write_cell(0, 0, left, header=True)
+            self.specs._write_cell(0, 1, right, header=True)
+        finally:
+            cur.endEditBlock()
 
     # Paste helpers
     def paste_key_from_clipboard(self):
@@ -751,24 +839,15 @@ class MainWindow(QMainWindow):
             if QMessageBox.question(self, "No rows", "The specs table is empty. Export anyway?") != QMessageBox.Yes:
                 return
 
-        lines = []
-        lines.append(SPEC_TABLE_CSS)
-        lines.append(f'<table border="1" class="specs">')
-        lines.append("\t<thead>")
-        lines.append("\t\t<tr>")
-        lines.append(f"\t\t\t<th>{_escape_html(left_h)}</th>")
-        lines.append(f"\t\t\t<th>{_escape_html(right_h)}</th>")
-        lines.append("\t\t</tr>")
-        lines.append("\t</thead>")
-        lines.append("\t<tbody>")
+        # One growing buffer; the skeleton comes from the frozen templates
+        buf = StringIO()
+        buf.write(SPEC_TABLE_CSS)
+        buf.write('\n')
+        buf.write(_TABLE_HEAD.format(lh=_escape_html(left_h), rh=_escape_html(right_h)))
         for key_plain, val_html in rows:
-            lines.append("\t\t<tr>")
-            lines.append(f"\t\t\t<th>{_escape_html(key_plain)}</th>")
-            lines.append(f"\t\t\t<td>{val_html}</td>")
-            lines.append("\t\t</tr>")
-        lines.append("\t</tbody>")
-        lines.append("</table>")
-        out = "\n".join(lines)
+            buf.write(_ROW_TMPL.format(k=_escape_html(key_plain), v=val_html))
+        buf.write(_TABLE_TAIL)
+        out = buf.getvalue()
 
         # Filename based on Title
         base = _sanitize_filename(self.title_in.text().strip() or DEFAULT_EXPORT_TITLE)
@@ -780,7 +859,7 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
-            with open(path, "w", encoding="utf-8") as f:
+            with open(path, "w", encoding="utf-8", newline="\n") as f:
                 f.write(out)
             self.statusBar().showMessage(f"Saved to {path}", 4000)
         except Exception as e:
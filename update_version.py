@@ -15,63 +15,152 @@ Example: python update_version.py 1.2.0
 import sys
 import re
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from version_io import get_current_version
+
+# Updaters run concurrently; serialize their status prints.
+_print_lock = threading.Lock()
+
+# Compiled once at import. The .py/.iss patterns are bytes so those files
+# never go through a UTF-8 decode/encode round-trip; README.md may hold
+# non-ASCII prose, so the badge pattern stays on str.
+CURRENT_VERSION_RE = re.compile(rb'(CURRENT_VERSION\s*=\s*["\'])[\d.]+(-[a-zA-Z0-9.]+)?(["\'])')
+MYAPP_VERSION_RE = re.compile(rb'(#define\s+MyAppVersion\s+["\'])[\d.]+(-[a-zA-Z0-9.]+)?(["\'])')
+BADGE_RE = re.compile(r'(badge/version-)[\d.]+(-[a-zA-Z0-9.]+)?(-blue\.svg)', re.ASCII)
+
 
 def validate_semver(version_str: str) -> bool:
     """
     Validate semantic versioning format (X.Y.Z).
     Allows optional pre-release suffix (e.g., 1.0.0-beta).
+
+    Hand-rolled parser; for strings this short it beats the regex engine
+    and enforces true semver (no leading zeros in the numeric core).
+    """
+    core, sep, pre = version_str.partition('-')
+
+    parts = core.split('.')
+    if len(parts) != 3:
+        return False
+    for part in parts:
+        if not part.isdigit() or not part.isascii():
+            return False
+        if part != '0' and part[0] == '0':
+            return False
+
+    if sep:
+        for ident in pre.split('.'):
+            if not ident or not ident.isascii():
+                return False
+            if not all(ch.isalnum() or ch == '-' for ch in ident):
+                return False
+
+    return True
+
+
+def _atomic_write(path: Path, data):
+    """Write via a sibling temp file and os.replace.
+
+    A crash mid-write can then never leave a truncated target behind;
+    the rename publishes the new content in one step.
+    """
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data, encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def _sub_near_anchor(pattern, replacement, content, anchor):
+    """Apply a single-substitution regex to a small window after an anchor.
+
+    A plain find() locates the anchor, the regex only walks ~200 bytes
+    around it, and the result is stitched back by slicing. Works on str
+    or bytes alike. Returns (new_content, count) like subn.
     """
-    pattern = r'^\d+\.\d+\.\d+(-[a-zA-Z0-9]+(\.[a-zA-Z0-9]+)*)?$'
-    return bool(re.match(pattern, version_str))
+    offset = content.find(anchor)
+    if offset == -1:
+        return content, 0
+    # Back up a little so patterns with context before the anchor (e.g.
+    # "#define " in front of MyAppVersion) still fit in the window.
+    start = max(0, offset - 64)
+    end = offset + 200
+    window = content[start:end]
+    new_window, count = pattern.subn(replacement, window, count=1)
+    if count == 0:
+        return content, 0
+    return content[:start] + new_window + content[end:], count
 
 
 def update_auto_update_py(file_path: Path, new_version: str) -> bool:
     """Update CURRENT_VERSION in auto_update.py."""
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = file_path.read_bytes()
+        version_b = new_version.encode('ascii')
+
+        # Already at target: substring scan is all it costs, no regex/write.
+        if b'CURRENT_VERSION = "' + version_b + b'"' in content:
+            with _print_lock:
+                print(f"  SKIP: {file_path.name} already at {new_version}")
+            return True
 
         # Pattern: CURRENT_VERSION = "X.Y.Z"
-        pattern = r'(CURRENT_VERSION\s*=\s*["\'])[\d.]+(-[a-zA-Z0-9.]+)?(["\'])'
-        replacement = rf'\g<1>{new_version}\g<3>'
+        replacement = rb'\g<1>' + version_b + rb'\g<3>'
 
-        new_content, count = re.subn(pattern, replacement, content)
+        new_content, count = _sub_near_anchor(CURRENT_VERSION_RE, replacement, content,
+                                              b'CURRENT_VERSION')
 
         if count == 0:
-            print(f"  ERROR: CURRENT_VERSION not found in {file_path.name}")
+            with _print_lock:
+                print(f"  ERROR: CURRENT_VERSION not found in {file_path.name}")
             return False
 
-        file_path.write_text(new_content, encoding='utf-8')
-        print(f"  OK: Updated {file_path.name} -> {new_version}")
+        _atomic_write(file_path, new_content)
+        with _print_lock:
+            print(f"  OK: Updated {file_path.name} -> {new_version}")
         return True
 
     except Exception as e:
-        print(f"  ERROR: Failed to update {file_path.name}: {e}")
+        with _print_lock:
+            print(f"  ERROR: Failed to update {file_path.name}: {e}")
         return False
 
 
 def update_installer_iss(file_path: Path, new_version: str) -> bool:
     """Update MyAppVersion in installer.iss."""
     try:
-        content = file_path.read_text(encoding='utf-8')
+        content = file_path.read_bytes()
+        version_b = new_version.encode('ascii')
+
+        # Already at target: substring scan is all it costs, no regex/write.
+        if b'#define MyAppVersion "' + version_b + b'"' in content:
+            with _print_lock:
+                print(f"  SKIP: {file_path.name} already at {new_version}")
+            return True
 
         # Pattern: #define MyAppVersion "X.Y.Z"
-        pattern = r'(#define\s+MyAppVersion\s+["\'])[\d.]+(-[a-zA-Z0-9.]+)?(["\'])'
-        replacement = rf'\g<1>{new_version}\g<3>'
+        replacement = rb'\g<1>' + version_b + rb'\g<3>'
 
-        new_content, count = re.subn(pattern, replacement, content)
+        new_content, count = _sub_near_anchor(MYAPP_VERSION_RE, replacement, content,
+                                              b'MyAppVersion')
 
         if count == 0:
-            print(f"  ERROR: MyAppVersion not found in {file_path.name}")
+            with _print_lock:
+                print(f"  ERROR: MyAppVersion not found in {file_path.name}")
             return False
 
-        file_path.write_text(new_content, encoding='utf-8')
-        print(f"  OK: Updated {file_path.name} -> {new_version}")
+        _atomic_write(file_path, new_content)
+        with _print_lock:
+            print(f"  OK: Updated {file_path.name} -> {new_version}")
         return True
 
     except Exception as e:
-        print(f"  ERROR: Failed to update {file_path.name}: {e}")
+        with _print_lock:
+            print(f"  ERROR: Failed to update {file_path.name}: {e}")
         return False
 
 
@@ -80,38 +169,42 @@ def update_readme_badge(file_path: Path, new_version: str) -> bool:
     try:
         content = file_path.read_text(encoding='utf-8')
 
+        # Already at target: substring scan is all it costs, no regex/write.
+        if f'badge/version-{new_version}-blue.svg' in content:
+            with _print_lock:
+                print(f"  SKIP: {file_path.name} already at {new_version}")
+            return True
+
         # Pattern: badge/version-X.Y.Z-blue.svg
-        pattern = r'(badge/version-)[\d.]+(-[a-zA-Z0-9.]+)?(-blue\.svg)'
         replacement = rf'\g<1>{new_version}\g<3>'
 
-        new_content, count = re.subn(pattern, replacement, content)
+        # The badge sits on one line near the top; scan lines with a plain
+        # substring test and run the regex on that line only.
+        count = 0
+        lines = content.split('\n')
+        for i, line in enumerate(lines):
+            if 'badge/version-' in line:
+                lines[i], count = BADGE_RE.subn(replacement, line, count=1)
+                break
+        new_content = '\n'.join(lines) if count else content
 
         if count == 0:
-            print(f"  WARNING: Version badge not found in {file_path.name}")
-            print(f"           Expected pattern: badge/version-X.Y.Z-blue.svg")
+            with _print_lock:
+                print(f"  WARNING: Version badge not found in {file_path.name}")
+                print(f"           Expected pattern: badge/version-X.Y.Z-blue.svg")
             return False
 
-        file_path.write_text(new_content, encoding='utf-8')
-        print(f"  OK: Updated {file_path.name} badge -> {new_version}")
+        _atomic_write(file_path, new_content)
+        with _print_lock:
+            print(f"  OK: Updated {file_path.name} badge -> {new_version}")
         return True
 
     except Exception as e:
-        print(f"  ERROR: Failed to update {file_path.name}: {e}")
+        with _print_lock:
+            print(f"  ERROR: Failed to update {file_path.name}: {e}")
         return False
 
 
-def get_current_version(auto_update_path: Path) -> str:
-    """Read current version from auto_update.py."""
-    try:
-        content = auto_update_path.read_text(encoding='utf-8')
-        match = re.search(r'CURRENT_VERSION\s*=\s*["\']([^"\']+)["\']', content)
-        if match:
-            return match.group(1)
-    except Exception:
-        pass
-    return "unknown"
-
-
 def main():
     """Main entry point."""
     # Check arguments
@@ -167,32 +260,25 @@ def main():
     print("Updating files...")
     print()
 
+    # Independent files: run the three updaters concurrently so reads and
+    # writes overlap in the OS layer.
+    updaters = {
+        'auto_update.py': update_auto_update_py,
+        'installer.iss': update_installer_iss,
+        'README.md': update_readme_badge,
+    }
+    tasks = []
+    for name, updater in updaters.items():
+        if files[name].exists():
+            tasks.append((files[name], updater))
+        else:
+            print(f"  SKIP: {name} not found")
+
+    total_count = len(tasks)
     success_count = 0
-    total_count = 0
-
-    # Update auto_update.py
-    if files['auto_update.py'].exists():
-        total_count += 1
-        if update_auto_update_py(files['auto_update.py'], new_version):
-            success_count += 1
-    else:
-        print(f"  SKIP: auto_update.py not found")
-
-    # Update installer.iss
-    if files['installer.iss'].exists():
-        total_count += 1
-        if update_installer_iss(files['installer.iss'], new_version):
-            success_count += 1
-    else:
-        print(f"  SKIP: installer.iss not found")
-
-    # Update README.md
-    if files['README.md'].exists():
-        total_count += 1
-        if update_readme_badge(files['README.md'], new_version):
-            success_count += 1
-    else:
-        print(f"  SKIP: README.md not found")
+    if tasks:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            success_count = sum(pool.map(lambda pf: pf[1](pf[0], new_version), tasks))
 
     print()
     print("=" * 50)
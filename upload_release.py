@@ -22,10 +22,22 @@ import json
 import ftplib
 import getpass
 import argparse
-import re
+import socket
+import hashlib
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 
+import version_io
+
+# Optional SFTP transport (graceful fallback if not available)
+try:
+    import paramiko
+    PARAMIKO_AVAILABLE = True
+except ImportError:
+    PARAMIKO_AVAILABLE = False
+
 # -----------------------------------------------------------------------------
 # Configuration
 # -----------------------------------------------------------------------------
@@ -45,40 +57,47 @@ DOWNLOAD_URL_BASE = f"https://downloads.graphicart.ch/{APP_NAME}"
 
 def get_current_version() -> str:
     """Read current version from auto_update.py."""
-    try:
-        content = AUTO_UPDATE_FILE.read_text(encoding='utf-8')
-        match = re.search(r'CURRENT_VERSION\s*=\s*["\']([^"\']+)["\']', content)
-        if match:
-            return match.group(1)
-    except Exception as e:
-        print(f"ERROR: Could not read version from auto_update.py: {e}")
-    return "0.0.0"
+    return version_io.get_current_version(AUTO_UPDATE_FILE, default="0.0.0")
+
 
+def find_latest_installer():
+    """Find the latest installer in installer_output/.
 
-def find_latest_installer() -> Path:
-    """Find the latest installer in installer_output/."""
+    Returns a (path, stat_result) tuple so callers reuse one stat() per
+    candidate instead of re-statting for mtime and size separately.
+    """
     if not INSTALLER_OUTPUT_DIR.exists():
         return None
 
-    # Look for setup files
-    installers = list(INSTALLER_OUTPUT_DIR.glob(f"{APP_NAME}_Setup_*.exe"))
-    if not installers:
-        installers = list(INSTALLER_OUTPUT_DIR.glob("*.exe"))
-
-    if not installers:
+    # One scandir pass covers both the Setup_* preference and the *.exe
+    # fallback; DirEntry.stat() comes from the dirent cache where the OS
+    # provides it.
+    prefix = f"{APP_NAME}_Setup_"
+    preferred = []
+    others = []
+    with os.scandir(INSTALLER_OUTPUT_DIR) as it:
+        for entry in it:
+            if not entry.name.endswith('.exe') or not entry.is_file():
+                continue
+            item = (Path(entry.path), entry.stat())
+            (preferred if entry.name.startswith(prefix) else others).append(item)
+
+    candidates = preferred or others
+    if not candidates:
         return None
 
     # Return the most recently modified
-    return max(installers, key=lambda p: p.stat().st_mtime)
+    return max(candidates, key=lambda e: e[1].st_mtime)
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # bit_length picks the unit directly instead of a division loop.
+    shift = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * shift)):.1f} {_SIZE_UNITS[shift]}"
 
 
 def ensure_remote_dir(ftp: ftplib.FTP, remote_path: str):
@@ -86,6 +105,13 @@ def ensure_remote_dir(ftp: ftplib.FTP, remote_path: str):
     Ensure remote directory exists, creating it if necessary.
     Handles nested paths by navigating through each part.
     """
+    # Steady state: the full path already exists, so one CWD settles it.
+    try:
+        ftp.cwd(remote_path)
+        return
+    except ftplib.error_perm:
+        pass
+
     parts = [p for p in remote_path.split('/') if p]
 
     # Start from root
@@ -132,22 +158,25 @@ def archive_old_version(ftp: ftplib.FTP, current_version: str):
         if 'latest.exe' not in files:
             return
 
-        # Ensure archive directory exists
+        # Ensure archive directory exists: one MKD instead of a cwd/cwd
+        # probe; an existing dir answers 550 which we swallow.
         archive_dir = 'archive'
         try:
-            ftp.cwd(archive_dir)
-            ftp.cwd('..')
-        except ftplib.error_perm:
             ftp.mkd(archive_dir)
             print(f"  Created archive directory")
+        except ftplib.error_perm as e:
+            if not str(e).startswith('550'):
+                raise
 
         # Try to read old version from version.json
         old_version = None
         if 'version.json' in files:
             try:
-                lines = []
-                ftp.retrlines('RETR version.json', lines.append)
-                data = json.loads('\n'.join(lines))
+                # One binary buffer, one decode, one parse — retrlines would
+                # build a Python string per line.
+                buf = bytearray()
+                ftp.retrbinary('RETR version.json', buf.extend)
+                data = json.loads(buf.decode('utf-8'))
                 old_version = data.get('version')
             except Exception:
                 pass
@@ -164,33 +193,166 @@ def archive_old_version(ftp: ftplib.FTP, current_version: str):
         print(f"  WARNING: Archive operation failed: {e}")
 
 
-def upload_file(ftp: ftplib.FTP, local_path: Path, remote_name: str):
-    """Upload a file with progress display."""
-    file_size = local_path.stat().st_size
-    uploaded = [0]
+# 1 MiB chunks: a multi-MB installer takes dozens of send() calls instead
+# of thousands at ftplib's 8 KiB default.
+UPLOAD_BLOCKSIZE = 1 << 20
+
+# One shared encoder for version.json; ensure_ascii keeps the C fast path
+# and lets the result encode as plain ASCII.
+_ENC = json.JSONEncoder(ensure_ascii=True, indent=2, separators=(',', ': ')).encode
 
-    def callback(data):
-        uploaded[0] += len(data)
-        percent = (uploaded[0] / file_size) * 100
-        bar_width = 40
-        filled = int(bar_width * uploaded[0] / file_size)
-        bar = '=' * filled + '-' * (bar_width - filled)
-        sys.stdout.write(f"\r  [{bar}] {percent:.1f}% ({format_size(uploaded[0])})")
-        sys.stdout.flush()
+
+def _tune_socket(sock):
+    """Disable Nagle and widen the send buffer on an FTP socket."""
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+    except OSError:
+        pass  # best effort; defaults still work
+
+
+def upload_file(ftp: ftplib.FTP, local_path: Path, remote_name: str, st=None) -> str:
+    """Upload a file with progress display. Returns the SHA-256 hex digest."""
+    file_size = (st or local_path.stat()).st_size
 
     print(f"  Uploading: {local_path.name} -> {remote_name}")
     print(f"  Size: {format_size(file_size)}")
 
-    with open(local_path, 'rb') as f:
-        ftp.storbinary(f'STOR {remote_name}', f, 8192, callback)
+    _tune_socket(ftp.sock)
+    h = hashlib.sha256()
+    uploaded = 0
+    last_percent = -1
+
+    # Hash on a worker thread so SHA-256 (GIL released inside hashlib)
+    # overlaps the socket sends instead of running between them.
+    chunks = queue.Queue(maxsize=4)
+
+    def _hash_worker():
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            h.update(chunk)
+
+    # Rotating pool of reusable buffers: readinto() never refills a buffer
+    # that may still sit in the queue or under the hasher (<= 5 in flight).
+    bufs = [bytearray(UPLOAD_BLOCKSIZE) for _ in range(6)]
+
+    ftp.voidcmd('TYPE I')
+    hasher = threading.Thread(target=_hash_worker, daemon=True)
+    hasher.start()
+    with open(local_path, 'rb') as f, ftp.transfercmd(f'STOR {remote_name}') as conn:
+        _tune_socket(conn)
+        i = 0
+        while True:
+            buf = bufs[i % len(bufs)]
+            i += 1
+            n = f.readinto(buf)
+            if not n:
+                break
+            chunk = memoryview(buf)[:n]
+            chunks.put(chunk)
+            conn.sendall(chunk)
+            uploaded += n
+            percent = (uploaded / file_size) * 100
+            # Only repaint on tenth-of-a-percent ticks; stdout flushing
+            # would otherwise dominate the loop on fast links.
+            new_pct = int(percent * 10)
+            if new_pct != last_percent:
+                last_percent = new_pct
+                bar_width = 40
+                filled = int(bar_width * uploaded / file_size)
+                bar = '=' * filled + '-' * (bar_width - filled)
+                sys.stdout.write(f"\r  [{bar}] {percent:.1f}% ({format_size(uploaded)})")
+                sys.stdout.flush()
+    chunks.put(None)
+    hasher.join()
+    ftp.voidresp()
 
     print()  # New line after progress bar
     print(f"  OK: Upload complete")
+    return h.hexdigest()
+
+
+def ensure_remote_dir_sftp(sftp, remote_path: str):
+    """Ensure remote directory exists over SFTP, creating parents as needed."""
+    current_path = ''
+    for part in [p for p in remote_path.split('/') if p]:
+        current_path += '/' + part
+        try:
+            sftp.stat(current_path)
+        except FileNotFoundError:
+            sftp.mkdir(current_path)
+            print(f"  Created directory: {current_path}")
+
+
+def upload_file_sftp(sftp, local_path: Path, remote_name: str, st=None) -> str:
+    """Upload a file over SFTP with pipelined writes. Returns the SHA-256 hex digest."""
+    file_size = (st or local_path.stat()).st_size
+    print(f"  Uploading: {local_path.name} -> {remote_name}")
+    print(f"  Size: {format_size(file_size)}")
+
+    h = hashlib.sha256()
+    uploaded = 0
+    last_percent = -1
+    with open(local_path, 'rb') as src, sftp.open(remote_name, 'wb') as dst:
+        # Pipelined: writes overlap ACKs instead of waiting per request
+        dst.set_pipelined(True)
+        while True:
+            chunk = src.read(UPLOAD_BLOCKSIZE)
+            if not chunk:
+                break
+            dst.write(chunk)
+            h.update(chunk)
+            uploaded += len(chunk)
+            percent = (uploaded / file_size) * 100
+            new_pct = int(percent * 10)
+            if new_pct != last_percent:
+                last_percent = new_pct
+                bar_width = 40
+                filled = int(bar_width * uploaded / file_size)
+                bar = '=' * filled + '-' * (bar_width - filled)
+                sys.stdout.write(f"\r  [{bar}] {percent:.1f}% ({format_size(uploaded)})")
+                sys.stdout.flush()
 
+    print()  # New line after progress bar
+    print(f"  OK: Upload complete")
+    return h.hexdigest()
 
-def generate_version_json(version: str, installer_path: Path, release_notes: str = None) -> dict:
+
+def upload_release_sftp(password: str, installer_path: Path, version_data: dict, installer_st=None):
+    """Upload installer + version.json over SFTP (paramiko)."""
+    transport = paramiko.Transport((FTP_HOST, 22))
+    try:
+        transport.connect(username=FTP_USER, password=password)
+        sftp = paramiko.SFTPClient.from_transport(transport)
+        print(f"  OK: Connected as {FTP_USER} (SFTP)")
+
+        print()
+        print(f"Preparing remote directory: {FTP_REMOTE_DIR}")
+        ensure_remote_dir_sftp(sftp, FTP_REMOTE_DIR)
+        print(f"  OK: Remote directory ready")
+
+        print()
+        print("Uploading installer...")
+        version_data["checksum_sha256"] = upload_file_sftp(
+            sftp, installer_path, f"{FTP_REMOTE_DIR}/latest.exe", installer_st
+        )
+
+        print()
+        print("Uploading version.json...")
+        json_bytes = _ENC(version_data).encode('ascii')
+        with sftp.open(f"{FTP_REMOTE_DIR}/version.json", 'wb') as f:
+            f.write(json_bytes)
+        print(f"  OK: version.json uploaded")
+    finally:
+        transport.close()
+
+
+def generate_version_json(version: str, installer_path: Path, release_notes: str = None,
+                          checksum: str = "", st=None) -> dict:
     """Generate version.json content."""
-    file_size = installer_path.stat().st_size
+    file_size = (st or installer_path.stat()).st_size
 
     return {
         "version": version,
@@ -200,19 +362,20 @@ def generate_version_json(version: str, installer_path: Path, release_notes: str
         "release_date": datetime.now().strftime("%Y-%m-%d"),
         "release_notes": release_notes or f"Version {version}",
         "minimum_version": "1.0.0",
-        "checksum_sha256": "",  # TODO: Add SHA256 checksum
+        "checksum_sha256": checksum,
     }
 
 
 def upload_version_json(ftp: ftplib.FTP, version_data: dict):
     """Upload version.json file."""
-    import io
-
-    json_content = json.dumps(version_data, indent=2, ensure_ascii=False)
-    json_bytes = json_content.encode('utf-8')
+    # Shared encoder, ASCII bytes, sent in a single sendall — no BytesIO staging.
+    json_bytes = _ENC(version_data).encode('ascii')
 
     print(f"  Uploading: version.json")
-    ftp.storbinary('STOR version.json', io.BytesIO(json_bytes))
+    ftp.voidcmd('TYPE I')
+    with ftp.transfercmd('STOR version.json') as conn:
+        conn.sendall(json_bytes)
+    ftp.voidresp()
     print(f"  OK: version.json uploaded")
 
 
@@ -225,6 +388,7 @@ def main():
     parser.add_argument('--password', '-p', help='FTP password (will prompt if not provided)')
     parser.add_argument('--notes', '-n', help='Release notes for version.json')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done without uploading')
+    parser.add_argument('--sftp', action='store_true', help='Upload over SFTP (requires paramiko)')
     args = parser.parse_args()
 
     print("=" * 60)
@@ -237,15 +401,16 @@ def main():
     print(f"Version: {version}")
     print()
 
-    # Find installer
-    installer_path = find_latest_installer()
-    if not installer_path:
+    # Find installer (one stat per candidate, reused below)
+    installer = find_latest_installer()
+    if not installer:
         print("ERROR: No installer found in installer_output/")
         print("       Run Inno Setup first to create the installer.")
         sys.exit(1)
+    installer_path, installer_st = installer
 
     print(f"Installer: {installer_path.name}")
-    print(f"Size: {format_size(installer_path.stat().st_size)}")
+    print(f"Size: {format_size(installer_st.st_size)}")
     print()
 
     if args.dry_run:
@@ -264,6 +429,35 @@ def main():
         print("ERROR: Password required")
         sys.exit(1)
 
+    if args.sftp:
+        if not PARAMIKO_AVAILABLE:
+            print("ERROR: --sftp requires paramiko (pip install paramiko)")
+            sys.exit(1)
+
+        release_notes = args.notes or input("Enter release notes (or press Enter for default): ").strip()
+        if not release_notes:
+            release_notes = f"Version {version}"
+        version_data = generate_version_json(version, installer_path, release_notes, st=installer_st)
+
+        print()
+        print(f"Connecting to {FTP_HOST} (SFTP)...")
+        try:
+            upload_release_sftp(password, installer_path, version_data, installer_st)
+        except Exception as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+
+        print()
+        print("=" * 60)
+        print("Upload Complete!")
+        print("=" * 60)
+        print()
+        print(f"Download URL: {DOWNLOAD_URL_BASE}/latest.exe")
+        print(f"Version JSON: {DOWNLOAD_URL_BASE}/version.json")
+        print()
+        print("NOTE: Archiving of the previous version is FTP-only.")
+        return
+
     print()
     print(f"Connecting to {FTP_HOST}...")
 
@@ -287,7 +481,7 @@ def main():
         # Upload installer as latest.exe
         print()
         print("Uploading installer...")
-        upload_file(ftp, installer_path, 'latest.exe')
+        checksum = upload_file(ftp, installer_path, 'latest.exe', installer_st)
 
         # Generate and upload version.json
         print()
@@ -296,7 +490,8 @@ def main():
         if not release_notes:
             release_notes = f"Version {version}"
 
-        version_data = generate_version_json(version, installer_path, release_notes)
+        version_data = generate_version_json(version, installer_path, release_notes, checksum,
+                                             installer_st)
         upload_version_json(ftp, version_data)
 
         # Done
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Shared version lookup for the release tooling.
+
+Reads CURRENT_VERSION from auto_update.py for both update_version.py and
+upload_release.py. The file read is memoized per (path, mtime), so repeated
+lookups in one run — or across chained scripts — cost one stat() until the
+file actually changes.
+"""
+
+import re
+import functools
+from pathlib import Path
+
+VERSION_READ_RE = re.compile(r'CURRENT_VERSION\s*=\s*["\']([^"\']+)["\']')
+
+
+@functools.lru_cache(maxsize=8)
+def _read(path: str, mtime: float) -> str:
+    return Path(path).read_text(encoding='utf-8')
+
+
+def get_current_version(path, default: str = "unknown") -> str:
+    """Read CURRENT_VERSION from the given auto_update.py path."""
+    path = Path(path)
+    try:
+        match = VERSION_READ_RE.search(_read(str(path), path.stat().st_mtime))
+        if match:
+            return match.group(1)
+    except Exception:
+        pass
+    return default